@@ -5,11 +5,25 @@ Provides convenient commands to run different test suites
 """
 
 import sys
+import json
 import subprocess
 import argparse
 from pathlib import Path
 
 
+# Per-test duration guard for the I/O-bound ProjectDataManager tests
+DURATIONS_TEST_PATH = "tests/unit/test_project_data.py"
+DURATIONS_BASELINE = Path("tests") / "fixtures" / "durations_baseline.json"
+DURATIONS_CURRENT = Path("durations_current.json")
+DURATIONS_MAX_RATIO = 2.0
+DURATIONS_MIN_SECONDS = 0.05  # Floor for the baseline, sub-50ms timings are mostly noise
+
+# Absolute per-test wall-time budget for the shared-widget TickTockWidget tests
+WIDGET_TIMING_TEST_PATH = "tests/unit/test_tick_tock_widget.py"
+WIDGET_TIMING_OUTPUT = Path("durations_widget.json")
+WIDGET_TIMING_MAX_SECONDS = 0.1
+
+
 def run_command(cmd, description=""):
     """Run a command and return the result"""
     if description:
@@ -26,13 +40,16 @@ def run_command(cmd, description=""):
     return result.returncode == 0
 
 
-def run_unit_tests(verbose=False, coverage=False):
+def run_unit_tests(verbose=False, coverage=False, workers=None):
     """Run unit tests"""
     cmd = ["python", "-m", "pytest", "tests/unit/"]
     
     if verbose:
         cmd.append("-v")
     
+    if workers:
+        cmd.extend(["-n", workers, "--dist", "loadgroup"])
+    
     if coverage:
         cmd.extend([
             "--cov=src/tick_tock_widget",
@@ -43,43 +60,55 @@ def run_unit_tests(verbose=False, coverage=False):
     return run_command(cmd, "Running unit tests")
 
 
-def run_integration_tests(verbose=False):
+def run_integration_tests(verbose=False, workers=None):
     """Run integration tests"""
     cmd = ["python", "-m", "pytest", "tests/integration/", "-m", "integration"]
     
     if verbose:
         cmd.append("-v")
     
+    if workers:
+        cmd.extend(["-n", workers, "--dist", "loadgroup"])
+    
     return run_command(cmd, "Running integration tests")
 
 
-def run_e2e_tests(verbose=False):
+def run_e2e_tests(verbose=False, workers=None):
     """Run end-to-end tests"""
     cmd = ["python", "-m", "pytest", "tests/e2e/", "-m", "e2e"]
     
     if verbose:
         cmd.append("-v")
     
+    if workers:
+        cmd.extend(["-n", workers, "--dist", "loadgroup"])
+    
     return run_command(cmd, "Running end-to-end tests")
 
 
-def run_gui_tests(verbose=False):
+def run_gui_tests(verbose=False, workers=None):
     """Run GUI tests (with mocked components)"""
     cmd = ["python", "-m", "pytest", "-m", "gui"]
     
     if verbose:
         cmd.append("-v")
     
+    if workers:
+        cmd.extend(["-n", workers, "--dist", "loadgroup"])
+    
     return run_command(cmd, "Running GUI tests")
 
 
-def run_all_tests(verbose=False, coverage=False):
+def run_all_tests(verbose=False, coverage=False, workers=None):
     """Run all test suites"""
     cmd = ["python", "-m", "pytest", "tests/"]
     
     if verbose:
         cmd.append("-v")
     
+    if workers:
+        cmd.extend(["-n", workers, "--dist", "loadgroup"])
+    
     if coverage:
         cmd.extend([
             "--cov=src/tick_tock_widget",
@@ -91,26 +120,91 @@ def run_all_tests(verbose=False, coverage=False):
     return run_command(cmd, "Running all tests")
 
 
-def run_fast_tests(verbose=False):
+def run_fast_tests(verbose=False, workers=None):
     """Run fast tests only (exclude slow tests)"""
     cmd = ["python", "-m", "pytest", "tests/", "-m", "not slow"]
     
     if verbose:
         cmd.append("-v")
     
+    if workers:
+        cmd.extend(["-n", workers, "--dist", "loadgroup"])
+    
     return run_command(cmd, "Running fast tests only")
 
 
-def run_specific_test(test_path, verbose=False):
+def run_specific_test(test_path, verbose=False, workers=None):
     """Run a specific test file or test function"""
     cmd = ["python", "-m", "pytest", test_path]
     
     if verbose:
         cmd.append("-v")
     
+    if workers:
+        cmd.extend(["-n", workers, "--dist", "loadgroup"])
+    
     return run_command(cmd, f"Running specific test: {test_path}")
 
 
+def run_duration_check(verbose=False, update_baseline=False):
+    """Run the duration-tracked tests and fail on >2x regressions against the baseline"""
+    output_file = DURATIONS_BASELINE if update_baseline else DURATIONS_CURRENT
+    cmd = ["python", "-m", "pytest", DURATIONS_TEST_PATH,
+           "--durations=10", f"--durations-json={output_file}"]
+    
+    if verbose:
+        cmd.append("-v")
+    
+    if not run_command(cmd, "Running duration-tracked tests"):
+        return False
+    
+    if update_baseline:
+        print(f"📝 Baseline updated: {DURATIONS_BASELINE}")
+        return True
+    
+    with open(DURATIONS_BASELINE, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(DURATIONS_CURRENT, 'r', encoding='utf-8') as f:
+        current = json.load(f)
+    
+    regressions = []
+    for nodeid, duration in current.items():
+        previous = baseline.get(nodeid)
+        if previous is None:
+            continue
+        if duration > max(previous, DURATIONS_MIN_SECONDS) * DURATIONS_MAX_RATIO:
+            regressions.append((nodeid, previous, duration))
+    
+    for nodeid, previous, duration in regressions:
+        print(f"🐢 {nodeid}: {previous:.3f}s -> {duration:.3f}s")
+    
+    return not regressions
+
+
+def run_widget_timing_check(verbose=False):
+    """Run the TickTockWidget tests and fail if any test's setup + call time exceeds the budget"""
+    cmd = ["python", "-m", "pytest", WIDGET_TIMING_TEST_PATH,
+           "--durations=0", f"--durations-min={DURATIONS_MIN_SECONDS}",
+           f"--durations-json={WIDGET_TIMING_OUTPUT}"]
+    
+    if verbose:
+        cmd.append("-v")
+    
+    if not run_command(cmd, "Running TickTockWidget timing check"):
+        return False
+    
+    with open(WIDGET_TIMING_OUTPUT, 'r', encoding='utf-8') as f:
+        current = json.load(f)
+    
+    slow_tests = {nodeid: duration for nodeid, duration in current.items()
+                  if duration > WIDGET_TIMING_MAX_SECONDS}
+    
+    for nodeid, duration in sorted(slow_tests.items(), key=lambda item: -item[1]):
+        print(f"🐢 {nodeid}: {duration:.3f}s > {WIDGET_TIMING_MAX_SECONDS:.3f}s")
+    
+    return not slow_tests
+
+
 def install_test_dependencies():
     """Install test dependencies"""
     cmd = ["python", "-m", "pip", "install", "-r", "requirements.txt"]
@@ -148,6 +242,7 @@ def main():
     parser = argparse.ArgumentParser(description="Tick-Tock Widget Test Runner")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
     parser.add_argument("-c", "--coverage", action="store_true", help="Generate coverage report")
+    parser.add_argument("-n", "--workers", help="Run tests in parallel with pytest-xdist (e.g. auto or 6)")
     
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
@@ -158,6 +253,9 @@ def main():
     subparsers.add_parser("gui", help="Run GUI tests")
     subparsers.add_parser("all", help="Run all tests")
     subparsers.add_parser("fast", help="Run fast tests only")
+    durations_parser = subparsers.add_parser("durations", help="Check test durations against baseline")
+    durations_parser.add_argument("--update-baseline", action="store_true", help="Record a new baseline")
+    subparsers.add_parser("widget-timing", help="Fail if any TickTockWidget test exceeds 100ms")
     
     # Specific test command
     specific_parser = subparsers.add_parser("run", help="Run specific test")
@@ -189,19 +287,23 @@ def main():
     success = True
     
     if args.command == "unit":
-        success = run_unit_tests(args.verbose, args.coverage)
+        success = run_unit_tests(args.verbose, args.coverage, args.workers)
     elif args.command == "integration":
-        success = run_integration_tests(args.verbose)
+        success = run_integration_tests(args.verbose, args.workers)
     elif args.command == "e2e":
-        success = run_e2e_tests(args.verbose)
+        success = run_e2e_tests(args.verbose, args.workers)
     elif args.command == "gui":
-        success = run_gui_tests(args.verbose)
+        success = run_gui_tests(args.verbose, args.workers)
     elif args.command == "all":
-        success = run_all_tests(args.verbose, args.coverage)
+        success = run_all_tests(args.verbose, args.coverage, args.workers)
     elif args.command == "fast":
-        success = run_fast_tests(args.verbose)
+        success = run_fast_tests(args.verbose, args.workers)
+    elif args.command == "durations":
+        success = run_duration_check(args.verbose, args.update_baseline)
+    elif args.command == "widget-timing":
+        success = run_widget_timing_check(args.verbose)
     elif args.command == "run":
-        success = run_specific_test(args.test_path, args.verbose)
+        success = run_specific_test(args.test_path, args.verbose, args.workers)
     elif args.command == "install":
         success = install_test_dependencies()
     elif args.command == "lint":
@@ -1537,8 +1537,7 @@ class ConfirmDialog:
     """Compact confirmation dialog"""
 
     def __init__(self, parent: Any, title: str, message: str) -> None:
-        self.parent = parent
-        self.result = False
+        self._init_state(parent)
 
         # Create borderless dialog window
         self.dialog = tk.Toplevel(parent)
@@ -1564,6 +1563,11 @@ class ConfirmDialog:
         # Focus on dialog (without grab_set to avoid freezing)
         self.dialog.focus_set()
 
+    def _init_state(self, parent: Any) -> None:
+        """Initialize dialog state that does not depend on Tk widgets"""
+        self.parent = parent
+        self.result = False
+
     def create_widgets(self, title: str, message: str) -> None:
         """Create ultra-compact borderless dialog widgets"""
         # Add thin border frame for borderless window
@@ -8,6 +8,7 @@ import tempfile
 import json
 from pathlib import Path
 from datetime import datetime, date
+from types import MappingProxyType
 from typing import Generator
 import sys
 import os
@@ -22,6 +23,16 @@ from tick_tock_widget.config import Config, Environment, reset_config
 from tick_tock_widget.theme_colors import ThemeColors
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _warmup():
+    """Import project_data and warm up the ISO date parsers once so per-test durations stay comparable"""
+    # Only cheap, side-effect free work here: a ProjectDataManager regression must fail
+    # in test_project_data.py, not in every test's setup
+    import tick_tock_widget.project_data  # noqa: F401
+    datetime.fromisoformat("2025-01-01")
+    date.fromisoformat("2025-01-01")
+
+
 @pytest.fixture(autouse=True)
 def isolate_config():
     """Automatically reset global config state before and after each test"""
@@ -453,62 +464,90 @@ def mock_tk_root():
     return MockTkRoot()
 
 
+@pytest.fixture(scope="session")
+def _gui_mocks_template():
+    """Fixture mapping each GUI patch target to its replacement, built once per session"""
+    return MappingProxyType({
+        'tkinter.Tk': MockTkRoot,
+        'tkinter.Toplevel': MockToplevel,
+        'tick_tock_widget.monthly_report.tk.Toplevel': MockToplevel,
+        'tick_tock_widget.minimized_widget.tk.Toplevel': MockToplevel,
+        # Add project_management patches
+        'tick_tock_widget.project_management.tk.Toplevel': MockToplevel,
+        'tick_tock_widget.project_management.tk.StringVar': MockStringVar,
+        'tick_tock_widget.project_management.tk.IntVar': MockIntVar,
+        'tick_tock_widget.project_management.tk.DoubleVar': MockDoubleVar,
+        'tick_tock_widget.project_management.tk.BooleanVar': MockBooleanVar,
+        'tkinter.StringVar': MockStringVar,
+        'tkinter.IntVar': MockIntVar,
+        'tkinter.DoubleVar': MockDoubleVar,
+        'tkinter.BooleanVar': MockBooleanVar,
+        # Also patch tk aliases for TickTockWidget
+        'tick_tock_widget.tick_tock_widget.tk.DoubleVar': MockDoubleVar,
+        'tick_tock_widget.tick_tock_widget.tk.StringVar': MockStringVar,
+        'tick_tock_widget.tick_tock_widget.tk.IntVar': MockIntVar,
+        'tick_tock_widget.tick_tock_widget.tk.BooleanVar': MockBooleanVar,
+        'tkinter.Frame': MockWidget,
+        'tkinter.Label': MockWidget,
+        'tkinter.Button': MockWidget,
+        'tkinter.Entry': MockWidget,
+        'tkinter.Text': MockWidget,
+        'tkinter.Listbox': MockWidget,
+        'tkinter.Canvas': MockWidget,
+        'tkinter.Scale': MockWidget,
+        'tkinter.Scrollbar': MockWidget,
+        'tkinter.Checkbutton': MockWidget,
+        'tkinter.Radiobutton': MockWidget,
+        'tkinter.Spinbox': MockWidget,
+        'tkinter.Menubutton': MockWidget,
+        'tkinter.Menu': MockWidget,
+        'tkinter.OptionMenu': MockWidget,
+        'tkinter.PanedWindow': MockWidget,
+        'tkinter.LabelFrame': MockWidget,
+        'tkinter.ttk.Treeview': MockWidget,
+        'tkinter.ttk.Style': MockWidget,
+        'tkinter.ttk.Combobox': MockWidget,
+        'tkinter.ttk.Scrollbar': MockWidget,
+        'tkinter.messagebox.showinfo': Mock(),
+        'tkinter.messagebox.showwarning': Mock(),
+        'tkinter.messagebox.showerror': Mock(),
+        'tkinter.messagebox.askquestion': Mock(return_value='yes'),
+        'tkinter.messagebox.askyesno': Mock(return_value=True),
+        'tkinter.messagebox.askokcancel': Mock(return_value=True),
+        'tkinter.messagebox.askretrycancel': Mock(return_value=True),
+        'tkinter.messagebox.askyesnocancel': Mock(return_value=True),
+        'tkinter.filedialog.askopenfilename': Mock(return_value='test_file.txt'),
+        'tkinter.filedialog.asksaveasfilename': Mock(return_value='test_save.txt'),
+        'tkinter.filedialog.askdirectory': Mock(return_value='/test/dir'),
+    })
+
+
+def _gui_patches(template):
+    """Build patchers for the template, clearing call history left on its shared dialog mocks"""
+    for replacement in template.values():
+        if isinstance(replacement, Mock):
+            replacement.reset_mock()
+    return [patch(target, replacement) for target, replacement in template.items()]
+
+
 @pytest.fixture
-def mock_gui_components():
+def mock_gui_components(_gui_mocks_template):
     """Fixture that mocks all GUI components to prevent windows during tests"""
-    patches = [
-        patch('tkinter.Tk', MockTkRoot),
-        patch('tkinter.Toplevel', MockToplevel),
-        patch('tick_tock_widget.monthly_report.tk.Toplevel', MockToplevel),
-        patch('tick_tock_widget.minimized_widget.tk.Toplevel', MockToplevel),
-        # Add project_management patches  
-        patch('tick_tock_widget.project_management.tk.Toplevel', MockToplevel),
-        patch('tick_tock_widget.project_management.tk.StringVar', MockStringVar),
-        patch('tick_tock_widget.project_management.tk.IntVar', MockIntVar),
-        patch('tick_tock_widget.project_management.tk.DoubleVar', MockDoubleVar),
-        patch('tick_tock_widget.project_management.tk.BooleanVar', MockBooleanVar),
-        patch('tkinter.StringVar', MockStringVar),
-        patch('tkinter.IntVar', MockIntVar),
-        patch('tkinter.DoubleVar', MockDoubleVar),
-        patch('tkinter.BooleanVar', MockBooleanVar),
-        # Also patch tk aliases for TickTockWidget
-        patch('tick_tock_widget.tick_tock_widget.tk.DoubleVar', MockDoubleVar),
-        patch('tick_tock_widget.tick_tock_widget.tk.StringVar', MockStringVar),
-        patch('tick_tock_widget.tick_tock_widget.tk.IntVar', MockIntVar),
-        patch('tick_tock_widget.tick_tock_widget.tk.BooleanVar', MockBooleanVar),
-        patch('tkinter.Frame', MockWidget),
-        patch('tkinter.Label', MockWidget),
-        patch('tkinter.Button', MockWidget),
-        patch('tkinter.Entry', MockWidget),
-        patch('tkinter.Text', MockWidget),
-        patch('tkinter.Listbox', MockWidget),
-        patch('tkinter.Canvas', MockWidget),
-        patch('tkinter.Scale', MockWidget),
-        patch('tkinter.Scrollbar', MockWidget),
-        patch('tkinter.Checkbutton', MockWidget),
-        patch('tkinter.Radiobutton', MockWidget),
-        patch('tkinter.Spinbox', MockWidget),
-        patch('tkinter.Menubutton', MockWidget),
-        patch('tkinter.Menu', MockWidget),
-        patch('tkinter.OptionMenu', MockWidget),
-        patch('tkinter.PanedWindow', MockWidget),
-        patch('tkinter.LabelFrame', MockWidget),
-        patch('tkinter.ttk.Treeview', MockWidget),
-        patch('tkinter.ttk.Style', MockWidget),
-        patch('tkinter.ttk.Combobox', MockWidget),
-        patch('tkinter.ttk.Scrollbar', MockWidget),
-        patch('tkinter.messagebox.showinfo', Mock()),
-        patch('tkinter.messagebox.showwarning', Mock()),
-        patch('tkinter.messagebox.showerror', Mock()),
-        patch('tkinter.messagebox.askquestion', Mock(return_value='yes')),
-        patch('tkinter.messagebox.askyesno', Mock(return_value=True)),
-        patch('tkinter.messagebox.askokcancel', Mock(return_value=True)),
-        patch('tkinter.messagebox.askretrycancel', Mock(return_value=True)),
-        patch('tkinter.messagebox.askyesnocancel', Mock(return_value=True)),
-        patch('tkinter.filedialog.askopenfilename', Mock(return_value='test_file.txt')),
-        patch('tkinter.filedialog.asksaveasfilename', Mock(return_value='test_save.txt')),
-        patch('tkinter.filedialog.askdirectory', Mock(return_value='/test/dir')),
-    ]
+    patches = _gui_patches(_gui_mocks_template)
+    
+    for p in patches:
+        p.start()
+    
+    yield
+    
+    for p in patches:
+        p.stop()
+
+
+@pytest.fixture(scope="module")
+def module_gui_components(_gui_mocks_template):
+    """Module-scoped variant of mock_gui_components for fixtures shared across a module"""
+    patches = _gui_patches(_gui_mocks_template)
     
     for p in patches:
         p.start()
@@ -804,29 +843,57 @@ def freeze_time():
         yield test_time
 
 
+def _build_mock_config(data_file):
+    """Build a mock Config with the return values the widget needs during init"""
+    mock_config = Mock()
+    # Point saves at a temporary file so test runs never rewrite files in the repo
+    mock_config.get_data_file.return_value = str(data_file)
+    mock_config.get_auto_save_interval.return_value = 300
+    mock_config.is_backup_enabled.return_value = True
+    mock_config.get_backup_directory.return_value = Path("backups")
+    mock_config.get_max_backups.return_value = 10
+    mock_config.get_environment.return_value = Environment.TEST
+    mock_config.is_debug_mode.return_value = False
+    mock_config.get_auto_idle_time_seconds.return_value = 300
+    mock_config.get_timer_popup_interval_seconds.return_value = 600
+    mock_config.get_window_title.return_value = "Tick-Tock Widget [TEST]"
+    mock_config.get_title_color.return_value = "#FFFF00"
+    mock_config.get_border_color.return_value = "#444400"
+    return mock_config
+
+
+def _get_config_patches(data_file):
+    """Build a mock get_config around a fresh Config mock and return patches installing it in both modules"""
+    # A fresh Config per fixture keeps return values set by one test out of the next
+    get_config_mock = Mock(return_value=_build_mock_config(data_file))
+    patches = [
+        patch('tick_tock_widget.project_data.get_config', get_config_mock),
+        patch('tick_tock_widget.tick_tock_widget.get_config', get_config_mock),
+    ]
+    return get_config_mock, patches
+
+
 @pytest.fixture
-def mock_get_config():
+def mock_get_config(tmp_path):
     """Fixture providing a mock get_config function with proper return values"""
-    with patch('tick_tock_widget.project_data.get_config') as mock_get_config_func, \
-         patch('tick_tock_widget.tick_tock_widget.get_config') as mock_widget_get_config:
-        mock_config = Mock()
-        # Use proper path to fixtures instead of relative "test_data.json"
-        test_data_path = Path(__file__).parent / "fixtures" / "test_data.json"
-        mock_config.get_data_file.return_value = str(test_data_path)
-        mock_config.get_auto_save_interval.return_value = 300
-        mock_config.is_backup_enabled.return_value = True
-        mock_config.get_backup_directory.return_value = Path("backups")
-        mock_config.get_max_backups.return_value = 10
-        mock_config.get_environment.return_value = Environment.TEST
-        mock_config.is_debug_mode.return_value = False
-        mock_config.get_auto_idle_time_seconds.return_value = 300
-        mock_config.get_timer_popup_interval_seconds.return_value = 600
-        mock_config.get_window_title.return_value = "Tick-Tock Widget [TEST]"
-        mock_config.get_title_color.return_value = "#FFFF00"
-        mock_config.get_border_color.return_value = "#444400"
-        mock_get_config_func.return_value = mock_config
-        mock_widget_get_config.return_value = mock_config
-        yield mock_widget_get_config
+    get_config_mock, patches = _get_config_patches(tmp_path / "test_data.json")
+    for p in patches:
+        p.start()
+    yield get_config_mock
+    for p in reversed(patches):
+        p.stop()
+
+
+@pytest.fixture(scope="module")
+def module_get_config(tmp_path_factory):
+    """Module-scoped variant of mock_get_config for fixtures shared across a module"""
+    data_file = tmp_path_factory.mktemp("module_data") / "test_data.json"
+    get_config_mock, patches = _get_config_patches(data_file)
+    for p in patches:
+        p.start()
+    yield get_config_mock
+    for p in reversed(patches):
+        p.stop()
 
 
 @pytest.fixture
@@ -879,3 +946,36 @@ def clean_test_data(test_data_file: Path) -> Generator[Path, None, None]:
     # Optionally clean up after test (uncomment if desired)
     # with open(test_data_file, 'w', encoding='utf-8') as f:
     #     json.dump(clean_data, f, indent=2)
+
+
+def pytest_addoption(parser):
+    """Register the --durations-json option"""
+    parser.addoption(
+        "--durations-json",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Write per-test setup + call durations as {nodeid: seconds} JSON to PATH"
+    )
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Dump per-test setup + call durations when --durations-json is given"""
+    output_path = terminalreporter.config.getoption("durations_json")
+    if not output_path:
+        return
+    
+    # Stats are keyed by outcome; setup covers fixture work such as widget construction
+    durations = {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) in ("setup", "call"):
+                durations[report.nodeid] = durations.get(report.nodeid, 0.0) + report.duration
+    durations = {nodeid: round(duration, 4) for nodeid, duration in durations.items()}
+    
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(dict(sorted(durations.items())), f, indent=2)
+        f.write("\n")
+    terminalreporter.write_line(f"Test durations written to {output_file}")
@@ -0,0 +1,75 @@
+"""
+Shared fixtures for unit tests
+"""
+import sys
+
+import pytest
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock
+
+
+@pytest.fixture(scope="session")
+def theme():
+    """Fixture providing a read-only theme dict shared by the whole test run"""
+    return MappingProxyType({
+        'name': 'Test',
+        'bg': '#000000',
+        'fg': '#FFFFFF',
+        'accent': '#0078D4',
+        'button_bg': '#404040',
+        'button_fg': '#FFFFFF',
+        'button_active': '#505050'
+    })
+
+
+@pytest.fixture
+def mock_parent():
+    """Fixture providing a parent widget positioned at (100, 100), with a root at the same spot"""
+    return SimpleNamespace(
+        winfo_x=lambda: 100,
+        winfo_y=lambda: 100,
+        root=SimpleNamespace(winfo_x=lambda: 100, winfo_y=lambda: 100)
+    )
+
+
+@pytest.fixture
+def frozen_true(monkeypatch):
+    """Fixture running the test as a frozen (PyInstaller) executable"""
+    monkeypatch.setattr(sys, 'frozen', True, raising=False)
+
+
+@pytest.fixture
+def frozen_false(monkeypatch):
+    """Fixture running the test from source rather than a frozen executable"""
+    monkeypatch.setattr(sys, 'frozen', False, raising=False)
+
+
+@pytest.fixture(scope="module")
+def _shared_widget(module_gui_components, module_get_config):
+    """Fixture building one TickTockWidget per module, with snapshots of its post-init state"""
+    from tick_tock_widget.tick_tock_widget import TickTockWidget
+    
+    widget = TickTockWidget()
+    
+    # Stub the Tk scheduler so callbacks queued during init never fire in later tests
+    widget.root.after = Mock(return_value="stub_id")
+    widget.root.after_cancel = Mock()
+    
+    snapshots = [(obj, dict(vars(obj))) for obj in (widget, widget.root, widget.data_manager)]
+    return widget, snapshots
+
+
+@pytest.fixture
+def widget(_shared_widget):
+    """Fixture providing the module's shared TickTockWidget, reset to its post-init state"""
+    shared, snapshots = _shared_widget
+    
+    # Undo attribute changes and instance-level mocks left behind by earlier tests
+    for obj, state in snapshots:
+        vars(obj).clear()
+        vars(obj).update(state)
+    for value in vars(shared.root).values():
+        if isinstance(value, Mock):
+            value.reset_mock()
+    
+    return shared
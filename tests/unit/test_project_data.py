@@ -161,65 +161,44 @@ class TestSubActivity:
         assert isinstance(sub_activity.time_records["2025-08-13"], TimeRecord)
         assert sub_activity.time_records["2025-08-13"].total_seconds == 1800
     
-    @patch('tick_tock_widget.project_data.date')
-    def test_get_today_record_existing(self, mock_date):
-        """Test getting today's record when it exists"""
-        mock_date.today.return_value = date(2025, 8, 13)
-        
+    @pytest.mark.parametrize("preload,expect_create", [(True, False), (False, True)])
+    def test_get_today_record(self, freeze_time, preload, expect_create):
+        """Test getting today's record when it exists and when it must be created"""
         existing_record = TimeRecord(date="2025-08-13", total_seconds=1800)
         sub_activity = SubActivity(
             name="Coding",
             alias="CODE",
-            time_records={"2025-08-13": existing_record}
+            time_records={"2025-08-13": existing_record} if preload else {}
         )
         
         record = sub_activity.get_today_record()
-        assert record is existing_record
-        assert record.total_seconds == 1800
-    
-    @patch('tick_tock_widget.project_data.date')
-    def test_get_today_record_new(self, mock_date):
-        """Test getting today's record when it doesn't exist"""
-        mock_date.today.return_value = date(2025, 8, 13)
-        
-        sub_activity = SubActivity(
-            name="Coding",
-            alias="CODE",
-            time_records={}
-        )
         
-        record = sub_activity.get_today_record()
         assert isinstance(record, TimeRecord)
         assert record.date == "2025-08-13"
-        assert record.total_seconds == 0
         assert "2025-08-13" in sub_activity.time_records
+        assert sub_activity.time_records["2025-08-13"] is record
+        assert (record is not existing_record) is expect_create
+        assert record.total_seconds == (0 if expect_create else 1800)
     
-    def test_get_total_time_today(self):
+    def test_get_total_time_today(self, freeze_time):
         """Test getting formatted total time for today"""
-        with patch.object(SubActivity, 'get_today_record') as mock_get_record:
-            mock_record = Mock()
-            mock_record.get_formatted_time.return_value = "01:30:00"
-            mock_get_record.return_value = mock_record
-            
-            sub_activity = SubActivity(name="Coding", alias="CODE", time_records={})
-            result = sub_activity.get_total_time_today()
-            
-            assert result == "01:30:00"
-            mock_get_record.assert_called_once()
-            mock_record.get_formatted_time.assert_called_once()
+        sub_activity = SubActivity(
+            name="Coding",
+            alias="CODE",
+            time_records={"2025-08-13": TimeRecord(date="2025-08-13", total_seconds=5400)}
+        )
+        
+        assert sub_activity.get_total_time_today() == "01:30:00"
     
-    def test_is_running_today(self):
+    def test_is_running_today(self, freeze_time):
         """Test checking if sub-activity is running today"""
-        with patch.object(SubActivity, 'get_today_record') as mock_get_record:
-            mock_record = Mock()
-            mock_record.is_running = True
-            mock_get_record.return_value = mock_record
-            
-            sub_activity = SubActivity(name="Coding", alias="CODE", time_records={})
-            result = sub_activity.is_running_today()
-            
-            assert result is True
-            mock_get_record.assert_called_once()
+        sub_activity = SubActivity(
+            name="Coding",
+            alias="CODE",
+            time_records={"2025-08-13": TimeRecord(date="2025-08-13", is_running=True)}
+        )
+        
+        assert sub_activity.is_running_today() is True
 
 
 class TestProject:
@@ -365,14 +344,27 @@ class TestProject:
 class TestProjectDataManager:
     """Test ProjectDataManager class"""
     
-    @patch('tick_tock_widget.project_data.get_config')
-    def test_init_default(self, mock_get_config, temp_config_dir):
+    @pytest.fixture
+    def pdm_mock_config(self, tmp_path):
+        """Patch get_config for ProjectDataManager, yielding the mock config (data file under tmp_path)"""
+        with patch('tick_tock_widget.project_data.get_config') as mock_get_config:
+            mock_config = Mock()
+            mock_config.get_data_file.return_value = str(tmp_path / "test_data.json")
+            mock_config.get_auto_save_interval.return_value = 300
+            mock_config.get_environment.return_value = Environment.TEST
+            mock_get_config.return_value = mock_config
+            yield mock_config
+    
+    @pytest.fixture(autouse=True)
+    def _no_backup(self, pdm_mock_config):
+        """Keep the backup-creation path out of every test unless explicitly enabled"""
+        pdm_mock_config.is_backup_enabled.return_value = False
+    
+    def test_init_default(self, pdm_mock_config, tmp_path):
         """Test ProjectDataManager initialization with defaults"""
-        mock_config = Mock()
-        test_data_file = temp_config_dir / "test_data.json"
+        mock_config = pdm_mock_config
+        test_data_file = tmp_path / "test_data.json"
         mock_config.get_data_file.return_value = str(test_data_file)
-        mock_config.get_auto_save_interval.return_value = 300
-        mock_get_config.return_value = mock_config
         
         with patch.object(ProjectDataManager, 'load_projects', return_value=True):
             manager = ProjectDataManager()
@@ -383,12 +375,9 @@ class TestProjectDataManager:
             assert manager.current_sub_activity_alias is None
             mock_config.get_data_file.assert_called_once()
     
-    @patch('tick_tock_widget.project_data.get_config')
-    def test_init_custom_file(self, mock_get_config):
+    def test_init_custom_file(self, pdm_mock_config):
         """Test ProjectDataManager initialization with custom file"""
-        mock_config = Mock()
-        mock_config.get_auto_save_interval.return_value = 300
-        mock_get_config.return_value = mock_config
+        mock_config = pdm_mock_config
         
         with patch.object(ProjectDataManager, 'load_projects', return_value=True):
             manager = ProjectDataManager(data_file="custom.json")
@@ -397,9 +386,9 @@ class TestProjectDataManager:
             # Should not call config.get_data_file when custom file provided
             mock_config.get_data_file.assert_not_called()
     
-    def test_load_projects_valid_file(self, temp_config_dir):
+    def test_load_projects_valid_file(self, tmp_path):
         """Test loading projects from valid file"""
-        data_file = temp_config_dir / "test_data.json"
+        data_file = tmp_path / "test_data.json"
         
         # Create test data matching the actual format  
         test_data = {
@@ -428,29 +417,19 @@ class TestProjectDataManager:
         with open(data_file, 'w') as f:
             json.dump(test_data, f)
         
-        with patch('tick_tock_widget.project_data.get_config') as mock_get_config:
-            mock_config = Mock()
-            mock_config.get_auto_save_interval.return_value = 300
-            mock_get_config.return_value = mock_config
-            
-            manager = ProjectDataManager(data_file=str(data_file))
-            manager.load_projects()
-            
-            assert len(manager.projects) == 2
-            assert manager.projects[0].name == "Test Project 1"
-            assert manager.projects[0].alias == "TP1"
-            assert manager.projects[1].name == "Test Project 2" 
-            assert manager.projects[1].alias == "TP2"
-            assert manager.current_project_alias == "TP1"
-    
-    @patch('tick_tock_widget.project_data.get_config')
-    def test_load_projects_corrupted_file(self, mock_get_config, temp_config_dir):
-        """Test loading data from corrupted file"""
-        mock_config = Mock()
-        mock_config.get_auto_save_interval.return_value = 300
-        mock_get_config.return_value = mock_config
+        manager = ProjectDataManager(data_file=str(data_file))
+        manager.load_projects()
         
-        data_file = temp_config_dir / "corrupted.json"
+        assert len(manager.projects) == 2
+        assert manager.projects[0].name == "Test Project 1"
+        assert manager.projects[0].alias == "TP1"
+        assert manager.projects[1].name == "Test Project 2" 
+        assert manager.projects[1].alias == "TP2"
+        assert manager.current_project_alias == "TP1"
+    
+    def test_load_projects_corrupted_file(self, tmp_path):
+        """Test loading data from corrupted file"""
+        data_file = tmp_path / "corrupted.json"
         with open(data_file, 'w') as f:
             f.write("invalid json content")
         
@@ -459,58 +438,43 @@ class TestProjectDataManager:
         # Should have empty project list when file is corrupted
         assert manager.projects == []
     
-    def test_save_projects(self, temp_config_dir):
+    def test_save_projects(self, tmp_path):
         """Test saving projects to file"""
-        data_file = temp_config_dir / "save_test.json"
+        data_file = tmp_path / "save_test.json"
         
-        with patch('tick_tock_widget.project_data.get_config') as mock_get_config:
-            mock_config = Mock()
-            mock_config.get_auto_save_interval.return_value = 300
-            mock_config.is_backup_enabled.return_value = False  # Disable backup for test
-            mock_config.get_environment.return_value = Environment.TEST
-            mock_get_config.return_value = mock_config
-            
-            manager = ProjectDataManager(data_file=str(data_file))
-            
-            # Add a test project  
-            project = Project(
-                name="Test",
-                dz_number="DZ123",
-                alias="T",
-                sub_activities=[],
-                time_records={}
-            )
-            manager.projects.append(project)
-            
-            result = manager.save_projects(force=True)
-            
-            assert result is True
-            assert data_file.exists()
-            
-            # Verify saved content
-            with open(data_file, 'r') as f:
-                data = json.load(f)
-                assert "projects" in data
-                assert len(data["projects"]) == 1
-                assert data["projects"][0]["name"] == "Test"
-                assert data["projects"][0]["alias"] == "T"
+        manager = ProjectDataManager(data_file=str(data_file))
+        
+        # Add a test project  
+        project = Project(
+            name="Test",
+            dz_number="DZ123",
+            alias="T",
+            sub_activities=[],
+            time_records={}
+        )
+        manager.projects.append(project)
+        
+        result = manager.save_projects(force=True)
+        
+        assert result is True
+        assert data_file.exists()
+        
+        # Verify saved content
+        with open(data_file, 'r') as f:
+            data = json.load(f)
+            assert "projects" in data
+            assert len(data["projects"]) == 1
+            assert data["projects"][0]["name"] == "Test"
+            assert data["projects"][0]["alias"] == "T"
 
-    def test_save_projects_timing_behavior(self, temp_config_dir):
+    def test_save_projects_timing_behavior(self, tmp_path):
         """Test the timing behavior that was fixed in the auto-save bug"""
         from datetime import datetime, timedelta
         
-        data_file = temp_config_dir / "timing_test.json"
+        data_file = tmp_path / "timing_test.json"
         
-        with patch('tick_tock_widget.project_data.get_config') as mock_get_config, \
-             patch('tick_tock_widget.project_data.datetime') as mock_datetime:
-            
-            mock_config = Mock()
-            mock_config.get_auto_save_interval.return_value = 300  # 5 minutes
-            mock_config.is_backup_enabled.return_value = False
-            mock_config.get_environment.return_value = Environment.TEST
-            mock_get_config.return_value = mock_config
-            
-            # Set up time mocking
+        with patch('tick_tock_widget.project_data.datetime') as mock_datetime:
+            # Set up time mocking (auto-save interval is 5 minutes)
             base_time = datetime(2025, 8, 13, 12, 0, 0)
             mock_datetime.now.return_value = base_time
             
@@ -543,57 +507,35 @@ class TestProjectDataManager:
             assert result is True  # Should save now
             assert data_file.exists()  # File should be created
     
-    def test_add_project(self, temp_config_dir):
+    def test_add_project(self, pdm_mock_config):
         """Test adding a new project"""
-        with patch('tick_tock_widget.project_data.get_config') as mock_get_config:
-            # Configure the mock config
-            mock_config = Mock()
-            test_data_file = temp_config_dir / "test_data.json"
-            mock_config.get_data_file.return_value = str(test_data_file)
-            mock_config.get_auto_save_interval.return_value = 300
-            mock_config.is_backup_enabled.return_value = True
-            mock_config.get_backup_directory.return_value = temp_config_dir / "backups"
-            mock_config.get_max_backups.return_value = 10
-            mock_get_config.return_value = mock_config
+        with patch.object(ProjectDataManager, 'load_projects', return_value=True):
+            manager = ProjectDataManager()
             
-            with patch.object(ProjectDataManager, 'load_projects', return_value=True):
-                manager = ProjectDataManager()
-                
-                project = manager.add_project("Test Project", "DZ123", "TP")
-                
-                assert project is not None
-                assert len(manager.projects) == 1
-                assert manager.projects[0] is project
-                assert project.name == "Test Project"
-                assert project.dz_number == "DZ123"
-                assert project.alias == "TP"
-    
-    def test_add_project_duplicate_alias(self, temp_config_dir):
+            project = manager.add_project("Test Project", "DZ123", "TP")
+            
+            assert project is not None
+            assert len(manager.projects) == 1
+            assert manager.projects[0] is project
+            assert project.name == "Test Project"
+            assert project.dz_number == "DZ123"
+            assert project.alias == "TP"
+    
+    def test_add_project_duplicate_alias(self, pdm_mock_config):
         """Test adding project with duplicate alias"""
-        with patch('tick_tock_widget.project_data.get_config') as mock_get_config:
-            # Configure the mock config
-            mock_config = Mock()
-            test_data_file = temp_config_dir / "test_data.json"
-            mock_config.get_data_file.return_value = str(test_data_file)
-            mock_config.get_auto_save_interval.return_value = 300
-            mock_config.is_backup_enabled.return_value = True
-            mock_config.get_backup_directory.return_value = temp_config_dir / "backups"
-            mock_config.get_max_backups.return_value = 10
-            mock_get_config.return_value = mock_config
+        with patch.object(ProjectDataManager, 'load_projects', return_value=True):
+            manager = ProjectDataManager()
             
-            with patch.object(ProjectDataManager, 'load_projects', return_value=True):
-                manager = ProjectDataManager()
-                
-                # Add first project
-                manager.add_project("Project 1", "DZ123", "TEST")
-                
-                # Try to add second project with same alias
-                result = manager.add_project("Project 2", "DZ456", "TEST")
-                
-                assert result is None
-                assert len(manager.projects) == 1
+            # Add first project
+            manager.add_project("Project 1", "DZ123", "TEST")
+            
+            # Try to add second project with same alias
+            result = manager.add_project("Project 2", "DZ456", "TEST")
+            
+            assert result is None
+            assert len(manager.projects) == 1
     
-    def test_remove_project(self, mock_get_config):
+    def test_remove_project(self, pdm_mock_config):
         """Test removing a project"""
         with patch.object(ProjectDataManager, 'load_projects', return_value=True):
             manager = ProjectDataManager()
@@ -608,7 +550,7 @@ class TestProjectDataManager:
             assert result is True
             assert len(manager.projects) == 0
     
-    def test_remove_project_not_found(self, mock_get_config):
+    def test_remove_project_not_found(self, pdm_mock_config):
         """Test removing non-existent project"""
         with patch.object(ProjectDataManager, 'load_projects', return_value=True):
             manager = ProjectDataManager()
@@ -617,7 +559,7 @@ class TestProjectDataManager:
             
             assert result is False
     
-    def test_get_project(self, mock_get_config):
+    def test_get_project(self, pdm_mock_config):
         """Test getting project by alias"""
         with patch.object(ProjectDataManager, 'load_projects', return_value=True):
             manager = ProjectDataManager()
@@ -630,7 +572,7 @@ class TestProjectDataManager:
             result = manager.get_project("NONEXISTENT")
             assert result is None
     
-    def test_set_current_project(self, mock_get_config):
+    def test_set_current_project(self, pdm_mock_config):
         """Test setting current project"""
         with patch.object(ProjectDataManager, 'load_projects', return_value=True):
             manager = ProjectDataManager()
@@ -645,7 +587,7 @@ class TestProjectDataManager:
             result = manager.set_current_project("NONEXISTENT")
             assert result is False
     
-    def test_get_current_project(self, mock_get_config):
+    def test_get_current_project(self, pdm_mock_config):
         """Test getting current project"""
         with patch.object(ProjectDataManager, 'load_projects', return_value=True):
             manager = ProjectDataManager()
@@ -660,7 +602,7 @@ class TestProjectDataManager:
             result = manager.get_current_project()
             assert result is None
     
-    def test_start_stop_timers(self, mock_get_config):
+    def test_start_stop_timers(self, pdm_mock_config):
         """Test starting and stopping timers"""
         with patch('tick_tock_widget.project_data.date') as mock_date:
             
@@ -1,209 +1,233 @@
 """
 Unit tests for SecureConfig class and security features
 """
+import io
 import os
-import tempfile
+import sys
 import json
+from contextlib import contextmanager
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, mock_open, Mock
 
+import pytest
+
 from tick_tock_widget.secure_config import SecureConfig
 from tick_tock_widget.config import Environment, Config
 
+# Environment members bound once for the assertions below
+_DEV = Environment.DEVELOPMENT
+_PROTO = Environment.PROTOTYPE
+_PROD = Environment.PRODUCTION
 
-class TestSecureConfig:
-    """Test SecureConfig class functionality"""
 
-    def test_development_mode_behavior(self):
-        """Test SecureConfig behaves like normal Config in development mode"""
-        # Ensure we're not in executable mode
+# Keep every SecureConfig test on one xdist worker so the class fixtures are built once
+pytestmark = pytest.mark.xdist_group("secure_config")
+
+# Serialized user preferences, built once for the preferences-loading test
+_PREFS_JSON = json.dumps({"ui_settings": {"loaded": True}})
+_PREFS_DATA = json.loads(_PREFS_JSON)
+
+# Mutable holder for the fake user data directory; tests set .value and patch in _FAKE_DIR
+_SHARED_TEST_DIR = SimpleNamespace(value=None)
+_FAKE_DIR = lambda self: _SHARED_TEST_DIR.value
+
+
+@contextmanager
+def prototype_env(user_dir):
+    """Simulate a frozen prototype build whose user data lives in user_dir"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(sys, 'frozen', True, raising=False)
+        mp.setenv('TICK_TOCK_ENV', 'prototype')
+        mp.setattr(_SHARED_TEST_DIR, 'value', user_dir)
+        mp.setattr(SecureConfig, '_get_user_data_directory', _FAKE_DIR)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _clean_env(monkeypatch):
+    """Start every test without TICK_TOCK_* overrides from the outer environment"""
+    for name in list(os.environ):
+        if name.startswith("TICK_TOCK_"):
+            monkeypatch.delenv(name)
+
+
+class TestSecureConfigDevelopmentMode:
+    """Test a single development-mode SecureConfig shared across the class"""
+
+    @pytest.fixture(scope="class")
+    def dev_config(self):
+        """Fixture providing one development-mode SecureConfig per test class"""
         with patch('sys.frozen', False, create=True), \
-             patch.dict('os.environ', {}, clear=True):
-            
-            config = SecureConfig()
-            
-            # Should behave like regular config in development
-            assert not config.is_executable
-            assert not config.is_prototype_build
-            # In development mode, SecureConfig falls back to regular Config behavior
-            # which loads from config.json with environment "development"
-            assert config.get_environment() == Environment.DEVELOPMENT
-
-    def test_prototype_build_detection_via_env_var(self):
-        """Test prototype build detection via TICK_TOCK_ENV environment variable"""
-        with patch('sys.frozen', True, create=True), \
-             patch.dict(os.environ, {'TICK_TOCK_ENV': 'prototype'}, clear=True), \
-             patch.object(SecureConfig, '_get_user_data_directory') as mock_user_dir:
-            
-            mock_user_dir.return_value = Path(tempfile.gettempdir()) / "test_ticktock"
-            
-            config = SecureConfig()
-            
-            assert config.is_executable
-            assert config.is_prototype_build
+             patch.dict(os.environ, {}, clear=True):
+            yield SecureConfig()
 
-    def test_prototype_build_detection_via_executable(self):
-        """Test prototype build detection when running as executable"""
-        with patch('sys.frozen', True, create=True), \
-             patch.dict(os.environ, {}, clear=True), \
-             patch.object(SecureConfig, '_get_user_data_directory') as mock_user_dir, \
-             patch.object(SecureConfig, '_is_prototype_build', return_value=True):
-            
-            mock_user_dir.return_value = Path(tempfile.gettempdir()) / "test_ticktock"
-            
-            config = SecureConfig()
+    def test_development_mode_behavior(self, dev_config):
+        """Test SecureConfig behaves like normal Config in development mode"""
+        # Should behave like regular config in development
+        assert not dev_config.is_executable
+        assert not dev_config.is_prototype_build
+        # In development mode, SecureConfig falls back to regular Config behavior
+        # which loads from config.json with environment "development"
+        assert dev_config.get_environment() == _DEV
+
+    def test_environment_switching_allowed_in_development(self, dev_config):
+        """Test that environment switching works in development mode"""
+        try:
+            # Should allow environment switching in development
+            dev_config.set_environment(_PROD)
+            assert dev_config.get_environment() == _PROD
+        finally:
+            # Restore the shared instance for the other tests in this class
+            dev_config.set_environment(_DEV)
+
+    def test_save_config_in_development_mode(self, dev_config):
+        """Test config saving behavior in development mode"""
+        with patch.object(Config, 'save_config') as mock_save:
+            dev_config.save_config()
             
-            assert config.is_executable
-            # Should be prototype build when frozen and _is_prototype_build returns True
-            assert config.is_prototype_build
+            # Should call parent save_config method
+            mock_save.assert_called_once()
 
-    def test_secure_mode_initialization(self):
+    def test_config_comparison_with_base_class(self, dev_config):
+        """Test that SecureConfig maintains compatibility with base Config class"""
+        # Should have same interface
+        assert hasattr(dev_config, 'get_environment')
+        assert hasattr(dev_config, 'set_environment')
+        assert hasattr(dev_config, 'get_data_file')
+        assert hasattr(dev_config, 'is_backup_enabled')
+        assert hasattr(dev_config, 'save_config')
+        
+        # Should return same types
+        assert isinstance(dev_config.get_environment(), Environment)
+        assert isinstance(dev_config.is_backup_enabled(), bool)
+
+    def test_config_creation_functions(self, dev_config):
+        """Test that helper functions work without import errors"""
+        # Test that we can create configs without import issues
+        config1 = dev_config
+        config2 = SecureConfig("test_config.json")
+        
+        assert isinstance(config1, SecureConfig)
+        assert isinstance(config2, SecureConfig)
+
+
+class TestSecureConfigPrototypeMode:
+    """Test a single prototype-mode SecureConfig shared across the class"""
+
+    @pytest.fixture(scope="class")
+    def secure_user_dir(self, tmp_path_factory):
+        """Fixture providing the user data directory for the shared secure config"""
+        return tmp_path_factory.mktemp("ticktock_secure")
+
+    @pytest.fixture(scope="class")
+    def secure_config(self, secure_user_dir):
+        """Fixture providing one SecureConfig built in prototype secure mode"""
+        with prototype_env(secure_user_dir):
+            yield SecureConfig()
+
+    def test_prototype_build_detection_via_env_var(self, secure_config):
+        """Test prototype build detection via TICK_TOCK_ENV environment variable"""
+        assert secure_config.is_executable
+        assert secure_config.is_prototype_build
+
+    def test_secure_mode_initialization(self, secure_config, secure_user_dir):
         """Test secure mode initialization with proper directory setup"""
-        test_user_dir = Path(tempfile.gettempdir()) / "test_ticktock_secure"
+        config = secure_config
         
-        with patch('sys.frozen', True, create=True), \
-             patch.dict(os.environ, {'TICK_TOCK_ENV': 'prototype'}, clear=True), \
-             patch.object(SecureConfig, '_get_user_data_directory', return_value=test_user_dir):
-            
-            config = SecureConfig()
-            
-            # Check secure mode properties
-            assert config.is_prototype_build
-            assert config.user_data_root == test_user_dir
-            assert config.user_prefs_file == test_user_dir / "user_preferences.json"
-            
-            # Check locked configuration
-            assert config.get_environment() == Environment.PROTOTYPE
-            assert config.is_backup_enabled() is True
-            assert config.is_debug_mode() is False
-            assert config.get_auto_save_interval() == 300
+        # Check secure mode properties
+        assert config.is_prototype_build
+        assert config.user_data_root == secure_user_dir
+        assert config.user_prefs_file == secure_user_dir / "user_preferences.json"
+        
+        # Check locked configuration
+        assert config.get_environment() == _PROTO
+        assert config.is_backup_enabled() is True
+        assert config.is_debug_mode() is False
+        assert config.get_auto_save_interval() == 300
 
-    def test_environment_switching_blocked_in_secure_mode(self):
+    def test_environment_switching_blocked_in_secure_mode(self, secure_config):
         """Test that environment switching is blocked in secure mode"""
-        with patch('sys.frozen', True, create=True), \
-             patch.dict(os.environ, {'TICK_TOCK_ENV': 'prototype'}, clear=True), \
-             patch.object(SecureConfig, '_get_user_data_directory') as mock_user_dir:
-            
-            mock_user_dir.return_value = Path(tempfile.gettempdir()) / "test_ticktock"
-            
-            config = SecureConfig()
-            
-            # Attempt to change environment
-            original_env = config.get_environment()
-            config.set_environment(Environment.DEVELOPMENT)
-            
-            # Environment should remain unchanged
-            assert config.get_environment() == original_env
-            assert config.get_environment() == Environment.PROTOTYPE
-
-    def test_environment_switching_allowed_in_development(self):
-        """Test that environment switching works in development mode"""
-        with patch('sys.frozen', False, create=True), \
-             patch.dict(os.environ, {}, clear=True):
-            
-            config = SecureConfig()
-            
-            # Should allow environment switching in development
-            config.set_environment(Environment.PRODUCTION)
-            assert config.get_environment() == Environment.PRODUCTION
+        config = secure_config
+        
+        # Attempt to change environment
+        original_env = config.get_environment()
+        config.set_environment(_DEV)
+        
+        # Environment should remain unchanged
+        assert config.get_environment() == original_env
+        assert config.get_environment() == _PROTO
 
-    def test_critical_settings_protection_in_secure_mode(self):
+    def test_critical_settings_protection_in_secure_mode(self, secure_config):
         """Test that critical settings are protected in secure mode"""
-        with patch('sys.frozen', True, create=True), \
-             patch.dict(os.environ, {'TICK_TOCK_ENV': 'prototype'}, clear=True), \
-             patch.object(SecureConfig, '_get_user_data_directory') as mock_user_dir:
-            
-            mock_user_dir.return_value = Path(tempfile.gettempdir()) / "test_ticktock"
-            
-            config = SecureConfig()
-            
-            # Test backup_enabled protection
-            original_backup = config.is_backup_enabled()
-            config.set("backup_enabled", False)
-            assert config.is_backup_enabled() == original_backup  # Should be unchanged
-            
-            # Test debug_mode protection
-            original_debug = config.is_debug_mode()
-            config.set("debug_mode", True)
-            assert config.is_debug_mode() == original_debug  # Should be unchanged
-            
-            # Test auto_save_interval protection
-            original_interval = config.get_auto_save_interval()
-            config.set("auto_save_interval", 600)
-            assert config.get_auto_save_interval() == original_interval  # Should be unchanged
+        config = secure_config
+        
+        # Test backup_enabled protection
+        original_backup = config.is_backup_enabled()
+        config.set("backup_enabled", False)
+        assert config.is_backup_enabled() == original_backup  # Should be unchanged
+        
+        # Test debug_mode protection
+        original_debug = config.is_debug_mode()
+        config.set("debug_mode", True)
+        assert config.is_debug_mode() == original_debug  # Should be unchanged
+        
+        # Test auto_save_interval protection
+        original_interval = config.get_auto_save_interval()
+        config.set("auto_save_interval", 600)
+        assert config.get_auto_save_interval() == original_interval  # Should be unchanged
 
-    def test_allowed_settings_modification_in_secure_mode(self):
+    def test_allowed_settings_modification_in_secure_mode(self, secure_config):
         """Test that allowed settings (UI) can be modified in secure mode"""
-        with patch('sys.frozen', True, create=True), \
-             patch.dict(os.environ, {'TICK_TOCK_ENV': 'prototype'}, clear=True), \
-             patch.object(SecureConfig, '_get_user_data_directory') as mock_user_dir:
-            
-            mock_user_dir.return_value = Path(tempfile.gettempdir()) / "test_ticktock"
-            
-            config = SecureConfig()
-            
-            # UI settings should be modifiable
-            test_ui_settings = {"tree_states": {"test": True}}
-            config.set("ui_settings", test_ui_settings)
-            
-            assert config.get("ui_settings") == test_ui_settings
+        config = secure_config
+        
+        # UI settings should be modifiable
+        test_ui_settings = {"tree_states": {"test": True}}
+        config.set("ui_settings", test_ui_settings)
+        
+        assert config.get("ui_settings") == test_ui_settings
 
-    def test_hardcoded_values_in_secure_mode(self):
+    def test_hardcoded_values_in_secure_mode(self, secure_config):
         """Test that hardcoded values are returned in secure mode"""
-        with patch('sys.frozen', True, create=True), \
-             patch.dict(os.environ, {'TICK_TOCK_ENV': 'prototype'}, clear=True), \
-             patch.object(SecureConfig, '_get_user_data_directory') as mock_user_dir:
-            
-            mock_user_dir.return_value = Path(tempfile.gettempdir()) / "test_ticktock"
-            
-            config = SecureConfig()
-            
-            # Test hardcoded values from PROTOTYPE_LOCKED_CONFIG
-            assert config.get_environment() == Environment.PROTOTYPE
-            assert config.is_backup_enabled() is True
-            assert config.is_debug_mode() is False
-            assert config.get_auto_save_interval() == 300
-            assert config.get_max_backups() == 10
-
-    def test_data_file_path_in_secure_mode(self):
+        config = secure_config
+        
+        # Test hardcoded values from PROTOTYPE_LOCKED_CONFIG
+        assert config.get_environment() == _PROTO
+        assert config.is_backup_enabled() is True
+        assert config.is_debug_mode() is False
+        assert config.get_auto_save_interval() == 300
+        assert config.get_max_backups() == 10
+
+    def test_data_file_path_in_secure_mode(self, secure_config, secure_user_dir):
         """Test data file path handling in secure mode"""
-        test_user_dir = Path(tempfile.gettempdir()) / "test_ticktock_data"
+        data_file = secure_config.get_data_file()
+        expected_path = str(secure_user_dir / "tick_tock_projects_prototype.json")
         
-        with patch('sys.frozen', True, create=True), \
-             patch.dict(os.environ, {'TICK_TOCK_ENV': 'prototype'}, clear=True), \
-             patch.object(SecureConfig, '_get_user_data_directory', return_value=test_user_dir):
-            
-            config = SecureConfig()
-            
-            data_file = config.get_data_file()
-            expected_path = str(test_user_dir / "tick_tock_projects_prototype.json")
-            
-            assert data_file == expected_path
+        assert data_file == expected_path
 
-    def test_backup_directory_in_secure_mode(self):
+    def test_backup_directory_in_secure_mode(self, secure_config, secure_user_dir):
         """Test backup directory handling in secure mode"""
-        test_user_dir = Path(tempfile.gettempdir()) / "test_ticktock_backup"
+        backup_dir = secure_config.get_backup_directory()
+        expected_path = secure_user_dir / "backups"
         
-        with patch('sys.frozen', True, create=True), \
-             patch.dict(os.environ, {'TICK_TOCK_ENV': 'prototype'}, clear=True), \
-             patch.object(SecureConfig, '_get_user_data_directory', return_value=test_user_dir):
-            
-            config = SecureConfig()
-            
-            backup_dir = config.get_backup_directory()
-            expected_path = test_user_dir / "backups"
-            
-            assert backup_dir == expected_path
+        assert backup_dir == expected_path
+
 
-    def test_save_config_in_secure_mode(self):
+class TestSecureConfigPrototypeUserPreferences:
+    """Test prototype-mode user preference files, which are read and written per instance"""
+
+    def test_save_config_in_secure_mode(self, tmp_path_factory):
         """Test config saving behavior in secure mode"""
-        test_user_dir = Path(tempfile.gettempdir()) / "test_ticktock_save"
+        test_user_dir = tmp_path_factory.mktemp("ticktock_save")
+        opened = []
+        
+        def fake_open(*args, **kwargs):
+            opened.append(args)
+            return io.StringIO()
         
-        with patch('sys.frozen', True, create=True), \
-             patch.dict(os.environ, {'TICK_TOCK_ENV': 'prototype'}, clear=True), \
-             patch.object(SecureConfig, '_get_user_data_directory', return_value=test_user_dir), \
+        with prototype_env(test_user_dir), \
              patch('pathlib.Path.mkdir') as mock_mkdir, \
-             patch('builtins.open', mock_open()) as mock_file:
+             patch('builtins.open', fake_open):
             
             config = SecureConfig()
             config.set("ui_settings", {"test_setting": "test_value"})
@@ -214,43 +238,26 @@ class TestSecureConfig:
             mock_mkdir.assert_called_with(parents=True, exist_ok=True)
             
             # Should save to user preferences file (we verify the call was made)
-            assert mock_file.called
+            assert opened
 
-    def test_save_config_in_development_mode(self):
-        """Test config saving behavior in development mode"""
-        with patch('sys.frozen', False, create=True), \
-             patch.dict(os.environ, {}, clear=True), \
-             patch.object(Config, 'save_config') as mock_save:
-            
-            config = SecureConfig()
-            config.save_config()
-            
-            # Should call parent save_config method
-            mock_save.assert_called_once()
-
-    def test_user_preferences_loading(self):
+    def test_user_preferences_loading(self, tmp_path_factory):
         """Test loading user preferences from file"""
-        test_user_dir = Path(tempfile.gettempdir()) / "test_ticktock_load"
-        test_prefs_data = {"ui_settings": {"loaded": True}}
+        test_user_dir = tmp_path_factory.mktemp("ticktock_load")
         
-        with patch('sys.frozen', True, create=True), \
-             patch.dict(os.environ, {'TICK_TOCK_ENV': 'prototype'}, clear=True), \
-             patch.object(SecureConfig, '_get_user_data_directory', return_value=test_user_dir), \
+        with prototype_env(test_user_dir), \
              patch.object(Path, 'exists', return_value=True), \
-             patch('builtins.open', mock_open(read_data=json.dumps(test_prefs_data))):
+             patch('builtins.open', mock_open(read_data=_PREFS_JSON)):
             
             config = SecureConfig()
             
             # Should have loaded the UI settings
-            assert config.get("ui_settings") == test_prefs_data["ui_settings"]
+            assert config.get("ui_settings") == _PREFS_DATA["ui_settings"]
 
-    def test_user_preferences_loading_error_handling(self):
+    def test_user_preferences_loading_error_handling(self, tmp_path_factory):
         """Test error handling when loading user preferences fails"""
-        test_user_dir = Path(tempfile.gettempdir()) / "test_ticktock_error"
+        test_user_dir = tmp_path_factory.mktemp("ticktock_error")
         
-        with patch('sys.frozen', True, create=True), \
-             patch.dict(os.environ, {'TICK_TOCK_ENV': 'prototype'}, clear=True), \
-             patch.object(SecureConfig, '_get_user_data_directory', return_value=test_user_dir), \
+        with prototype_env(test_user_dir), \
              patch.object(Path, 'exists', return_value=True), \
              patch('builtins.open', side_effect=OSError("File error")):
             
@@ -258,38 +265,27 @@ class TestSecureConfig:
             config = SecureConfig()
             assert config.get("ui_settings", {}) == {}
 
-    def test_config_comparison_with_base_class(self):
-        """Test that SecureConfig maintains compatibility with base Config class"""
-        with patch('sys.frozen', False, create=True), \
-             patch.dict(os.environ, {}, clear=True):
-            
-            secure_config = SecureConfig()
-            
-            # Should have same interface
-            assert hasattr(secure_config, 'get_environment')
-            assert hasattr(secure_config, 'set_environment') 
-            assert hasattr(secure_config, 'get_data_file')
-            assert hasattr(secure_config, 'is_backup_enabled')
-            assert hasattr(secure_config, 'save_config')
-            
-            # Should return same types
-            assert isinstance(secure_config.get_environment(), Environment)
-            assert isinstance(secure_config.is_backup_enabled(), bool)
 
+class TestSecureConfigBuildDetection:
+    """Test prototype build detection, which needs a fresh SecureConfig per scenario"""
 
-class TestSecureConfigIntegration:
-    """Integration tests for SecureConfig with other components"""
+    def test_prototype_build_detection_via_executable(self, monkeypatch, tmp_path_factory, frozen_true):
+        """Test prototype build detection when running as executable"""
+        test_user_dir = tmp_path_factory.mktemp("ticktock")
+        monkeypatch.setattr(_SHARED_TEST_DIR, 'value', test_user_dir)
+        monkeypatch.setattr(SecureConfig, '_get_user_data_directory', _FAKE_DIR)
+        monkeypatch.setattr(SecureConfig, '_is_prototype_build', lambda self: True)
+        
+        config = SecureConfig()
+        
+        assert config.is_executable
+        # Should be prototype build when frozen and _is_prototype_build returns True
+        assert config.is_prototype_build
 
-    def test_integration_with_tick_tock_widget(self):
+    def test_integration_with_tick_tock_widget(self, tmp_path_factory):
         """Test integration with main TickTockWidget config initialization"""
-        with patch('sys.frozen', True, create=True), \
-             patch.dict('os.environ', {'TICK_TOCK_ENV': 'prototype'}, clear=True), \
-             patch.object(SecureConfig, '_get_user_data_directory') as mock_user_dir:
-            
-            mock_user_dir.return_value = Path(tempfile.gettempdir()) / "test_integration"
-            
+        with prototype_env(tmp_path_factory.mktemp("integration")):
             # Test the config detection logic that should run in __init__
-            import sys
             is_executable = getattr(sys, 'frozen', False)
             is_prototype_build = os.environ.get('TICK_TOCK_ENV', '').lower() == 'prototype'
             
@@ -301,59 +297,40 @@ class TestSecureConfigIntegration:
             assert isinstance(config, SecureConfig)
             assert config.is_prototype_build
 
-    def test_environment_variable_detection(self):
+    def test_environment_variable_detection(self, monkeypatch, tmp_path_factory, frozen_false):
         """Test environment variable detection logic"""
-        with patch.object(SecureConfig, '_get_user_data_directory') as mock_user_dir:
-            mock_user_dir.return_value = Path(tempfile.gettempdir()) / "test_env"
-            
-            # Test that without TICK_TOCK_ENV and not executable, should not be prototype
-            with patch.dict(os.environ, {}, clear=True), \
-                 patch('sys.frozen', False, create=True):
-                
-                config = SecureConfig()
-                assert not config.is_prototype_build, "Should not be prototype build without env var or executable"
-                
-            # Test that with TICK_TOCK_ENV=prototype, should be detected
-            with patch.dict(os.environ, {'TICK_TOCK_ENV': 'prototype'}, clear=True), \
-                 patch('sys.frozen', False, create=True):
-                
-                config = SecureConfig()
-                assert config.is_prototype_build, "Should detect TICK_TOCK_ENV=prototype"
-
-    def test_prototype_marker_file_detection(self):
+        test_user_dir = tmp_path_factory.mktemp("env")
+        monkeypatch.setattr(_SHARED_TEST_DIR, 'value', test_user_dir)
+        monkeypatch.setattr(SecureConfig, '_get_user_data_directory', _FAKE_DIR)
+        
+        # Test that without TICK_TOCK_ENV and not executable, should not be prototype
+        config = SecureConfig()
+        assert not config.is_prototype_build, "Should not be prototype build without env var or executable"
+        
+        # Test that with TICK_TOCK_ENV=prototype, should be detected
+        monkeypatch.setenv('TICK_TOCK_ENV', 'prototype')
+        config = SecureConfig()
+        assert config.is_prototype_build, "Should detect TICK_TOCK_ENV=prototype"
+
+    def test_prototype_marker_file_detection(self, monkeypatch, tmp_path_factory, frozen_true):
         """Test prototype detection via embedded marker file"""
-        with patch('sys.frozen', True, create=True), \
-             patch.dict(os.environ, {}, clear=True), \
-             patch.object(SecureConfig, '_get_user_data_directory') as mock_user_dir:
-            
-            mock_user_dir.return_value = Path(tempfile.gettempdir()) / "test_env"
+        test_user_dir = tmp_path_factory.mktemp("env")
+        monkeypatch.setattr(_SHARED_TEST_DIR, 'value', test_user_dir)
+        monkeypatch.setattr(SecureConfig, '_get_user_data_directory', _FAKE_DIR)
+        
+        # Test with MEIPASS (PyInstaller bundle)
+        with patch('sys._MEIPASS', '/tmp/meipass', create=True), \
+             patch('pathlib.Path.exists') as mock_exists:
             
-            # Test with MEIPASS (PyInstaller bundle)
-            with patch('sys._MEIPASS', '/tmp/meipass', create=True), \
-                 patch('pathlib.Path.exists') as mock_exists:
-                
-                mock_exists.return_value = True
-                config = SecureConfig()
-                assert config.is_prototype_build == True
-                
-            # Test without MEIPASS but with marker file next to executable
-            with patch('sys._MEIPASS', side_effect=AttributeError(), create=True), \
-                 patch('sys.executable', '/path/to/app.exe'), \
-                 patch('pathlib.Path.exists') as mock_exists:
-                
-                mock_exists.return_value = True
-                config = SecureConfig()
-                assert config.is_prototype_build == True
-
-
-class TestSecureConfigHelperFunctions:
-    """Test helper functions for SecureConfig"""
-
-    def test_config_creation_functions(self):
-        """Test that helper functions work without import errors"""
-        # Test that we can create configs without import issues
-        config1 = SecureConfig()
-        config2 = SecureConfig("test_config.json")
+            mock_exists.return_value = True
+            config = SecureConfig()
+            assert config.is_prototype_build == True
         
-        assert isinstance(config1, SecureConfig)
-        assert isinstance(config2, SecureConfig)
+        # Test without MEIPASS but with marker file next to executable
+        with patch('sys._MEIPASS', side_effect=AttributeError(), create=True), \
+             patch('sys.executable', '/path/to/app.exe'), \
+             patch('pathlib.Path.exists') as mock_exists:
+            
+            mock_exists.return_value = True
+            config = SecureConfig()
+            assert config.is_prototype_build == True